@@ -1,6 +1,7 @@
 """Button handling utilities for the rhythm game."""
 
 from typing import Dict, List, Optional, Tuple, Callable, Any, Set, NamedTuple, Sequence
+import numpy as np
 import pygame
 from pygame import Color
 import platform
@@ -216,6 +217,28 @@ class ButtonHandler:
                 return target_type
         return None
     
+    def positions_in_valid_window(self, positions: np.ndarray, window_size: Optional[int] = None) -> np.ndarray:
+        """Check many LED positions against every target window at once.
+        
+        Vectorized equivalent of calling get_target_type_for_position(...) is not None
+        for each position.
+        
+        Args:
+            positions: Integer array of LED positions to check
+            window_size: Size of the target window (defaults to target_window_size)
+            
+        Returns:
+            Boolean array, True where the position is in a target window
+        """
+        if window_size is None:
+            window_size = self.target_window_size
+        led_count = self.number_of_leds
+        in_window = np.zeros(np.shape(positions), dtype=bool)
+        for target_pos in self.target_positions.values():
+            distance = (positions - target_pos) % led_count
+            in_window |= np.minimum(distance, led_count - distance) <= window_size
+        return in_window
+    
     @staticmethod
     def get_keys_for_target(target_type: TargetType) -> List[int]:
         """Get the keyboard keys associated with a target type.
@@ -232,12 +255,12 @@ class ButtonHandler:
     def mod_distance(a, b, mod):
         return min((a - b) % mod, (b - a) % mod)
 
-    def get_window_boundaries(self, target_pos: int, hits_by_type: Dict[TargetType, List[int]], target_type: TargetType) -> Tuple[int, int]:
+    def get_window_boundaries(self, target_pos: int, hit_counts: Sequence[int], target_type: TargetType) -> Tuple[int, int]:
         """Calculate the start and end positions of a target window.
         
         Args:
             target_pos: The center position of the target window
-            hits_by_type: Dictionary mapping target types to their hit positions
+            hit_counts: Number of hits for each target type, indexed by TargetType.value
             target_type: The target type to get window boundaries for
             
         Returns:
@@ -246,7 +269,7 @@ class ButtonHandler:
         # Base window size is target_window_size
         window_size = self.target_window_size
         
-        num_hits = len(hits_by_type[target_type])
+        num_hits = hit_counts[target_type.value]
         if num_hits > 0:
             window_size = max(MIN_WINDOW_SIZE, window_size - num_hits*2)
         window_start = (target_pos - window_size) % self.number_of_leds
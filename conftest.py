@@ -0,0 +1,18 @@
+"""Shared pytest configuration for the rhythm game tests."""
+
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Spread test modules across CPU cores when pytest-xdist is installed.
+
+    Tests are distributed by file (--dist=loadfile) so each module's pygame
+    state stays on one worker. An explicit -n on the command line wins, and
+    without pytest-xdist the suite runs serially as before.
+    """
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    if config.option.numprocesses is None and config.option.dist == "no":
+        config.option.numprocesses = "auto"
+        config.option.dist = "loadfile"
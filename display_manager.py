@@ -3,7 +3,7 @@ import pygame
 import math
 import numpy as np
 from enum import Enum, auto
-from typing import Tuple, Protocol, Optional, Dict, List
+from typing import Tuple, Protocol, Optional, Dict, List, Union
 from pygame import Color
 from game_constants import *
 import game_constants
@@ -26,10 +26,61 @@ try:
 except ImportError:
     sacn = None
 
+# Optional JIT for the per-frame fade; falls back to the NumPy path without it
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    njit = None
+
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
+logging.getLogger('numba').setLevel(logging.WARNING)  # Its compiler debug output is very verbose
 logger = logging.getLogger(__name__)
 
+# Keep pushing an unchanged frame for this long after the last change so that
+# rate-limited outputs (sACN drops shows closer than 1/REFRESH_RATE apart) have
+# sent it before we start skipping identical frames.
+STATIC_FRAME_SETTLE_S = 0.1
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _fade_kernel(colors: np.ndarray, times: np.ndarray, now: float, out: np.ndarray) -> None:
+        """Fade and average both layers of every trail into out.
+        
+        Same rules as the NumPy path in DisplayManager._calculate_faded_colors.
+        
+        Args:
+            colors: Pixel colors with shape (num_trails, 2, led_count, 3)
+            times: Pixel [set_time, duration] with shape (num_trails, 2, led_count, 2)
+            now: Current time in seconds
+            out: Output colors with shape (num_trails, led_count, 3)
+        """
+        num_trails, num_layers, led_count, _ = colors.shape
+        for trail in range(num_trails):
+            for pos in range(led_count):
+                acc0 = 0
+                acc1 = 0
+                acc2 = 0
+                for layer in range(num_layers):
+                    duration = times[trail, layer, pos, 1]
+                    if duration > 0:
+                        elapsed = now - times[trail, layer, pos, 0]
+                        if elapsed >= duration:
+                            continue
+                        ratio = 1.0 - max(elapsed, 0.0) / duration
+                        acc0 += int(colors[trail, layer, pos, 0] * ratio)
+                        acc1 += int(colors[trail, layer, pos, 1] * ratio)
+                        acc2 += int(colors[trail, layer, pos, 2] * ratio)
+                    else:
+                        acc0 += colors[trail, layer, pos, 0]
+                        acc1 += colors[trail, layer, pos, 1]
+                        acc2 += colors[trail, layer, pos, 2]
+                out[trail, pos, 0] = acc0 >> 1
+                out[trail, pos, 1] = acc1 >> 1
+                out[trail, pos, 2] = acc2 >> 1
+
 class TrailType(Enum):
     """Types of trails that can be drawn."""
     TARGET = 0
@@ -310,6 +361,10 @@ class DisplayManager:
         num_trails = len(TrailType)
         self._active_colors_np = np.zeros((num_trails, 2, led_count, 3), dtype=np.uint8)
         self._active_times_np = np.full((num_trails, 2, led_count, 2), [-1.0, -1.0], dtype=np.float32)
+        
+        # Last frame pushed to the display, used to skip redrawing unchanged frames
+        self._last_faded_colors: Optional[np.ndarray] = None
+        self._last_change_s: float = 0.0
 
     def clear(self) -> None:
         """Clear the display by delegating to the display implementation."""
@@ -324,9 +379,18 @@ class DisplayManager:
         self.display.set_fifth_line_pixel(pos, color, trail_start_offset)
 
     def update(self) -> None:
-        """Update the display and fade out pixels if their duration has expired."""
+        """Update the display and fade out pixels if their duration has expired.
+        
+        Frames identical to the previous one are not redrawn or resent once the
+        output has been static for STATIC_FRAME_SETTLE_S.
+        """
         now = pygame.time.get_ticks() / 1000.0
         faded_colors = self._calculate_faded_colors(now)
+        if self._last_faded_colors is None or not np.array_equal(faded_colors, self._last_faded_colors):
+            self._last_faded_colors = faded_colors
+            self._last_change_s = now
+        elif now - self._last_change_s > STATIC_FRAME_SETTLE_S:
+            return
         self._update_display(faded_colors)
         self.display.show()
 
@@ -339,6 +403,11 @@ class DisplayManager:
         Returns:
             Array of faded colors with shape (num_trails, led_count, 3) after averaging layers
         """
+        if HAS_NUMBA:
+            averaged = np.empty(self._active_colors_np.shape[:1] + self._active_colors_np.shape[2:], dtype=np.uint8)
+            _fade_kernel(self._active_colors_np, self._active_times_np, now, averaged)
+            return averaged
+        
         # Get set_times and durations for all pixels
         set_times = self._active_times_np[:, :, :, 0]  # Shape: (num_trails, 2, led_count)
         durations = self._active_times_np[:, :, :, 1]  # Shape: (num_trails, 2, led_count)
@@ -397,13 +466,16 @@ class DisplayManager:
             setter = self._trail_properties[trail_type]['setter']
             
             # Find positions with non-zero colors
-            non_zero_mask = np.any(faded_colors[trail_idx] != 0, axis=1)
+            trail_colors = faded_colors[trail_idx]
+            non_zero_mask = np.any(trail_colors != 0, axis=1)
             non_zero_positions = np.where(non_zero_mask)[0]
             
-            # Update only non-zero pixels
-            for pos in non_zero_positions:
-                color = Color(*faded_colors[trail_idx, pos])
-                setter(pos, color)
+            # Gather all non-zero pixels in one vectorized pass and convert to
+            # Python ints up front rather than indexing numpy per pixel
+            positions = non_zero_positions.tolist()
+            rgb_values = trail_colors[non_zero_positions].tolist()
+            for pos, rgb in zip(positions, rgb_values):
+                setter(pos, Color(*rgb))
                 # logger.debug(f"Set pixel {pos} to RGB({color.r}, {color.g}, {color.b})")
         
         # Note: show() is called by update() after this method returns
@@ -436,6 +508,49 @@ class DisplayManager:
         self._active_colors_np[trail_idx, layer, pos] = [color.r, color.g, color.b]
         self._active_times_np[trail_idx, layer, pos] = [now, duration]
 
+    def _request_pixels_on_trail(self, positions: Union[slice, np.ndarray], colors: Union[np.ndarray, List[int]],
+                                 trail_type: TrailType, duration: float, layer: int) -> None:
+        """Request many pixels on a trail in a single array write.
+        
+        Args:
+            positions: Slice or integer array of LED positions, already wrapped to the strip.
+            colors: RGB values, either one [r, g, b] shared by all positions or an (n, 3) array.
+            trail_type: The type of trail (TARGET, HIT, or FIFTH_LINE).
+            duration: Duration (in seconds) for the pixels to remain on. If -1, the pixels remain until overridden.
+                    Must be either -1 (permanent) or > 0 (fading).
+            layer: The layer to set the pixels on.
+        """
+        if duration != -1 and duration <= 0:
+            raise ValueError("Duration must be either -1 (permanent) or > 0 (fading)")
+            
+        now = pygame.time.get_ticks() / 1000.0
+        
+        trail_idx = trail_type.value
+        self._active_colors_np[trail_idx, layer, positions] = colors
+        self._active_times_np[trail_idx, layer, positions] = [now, duration]
+
+    def _request_range_on_trail(self, start: int, count: int, color: Color, trail_type: TrailType,
+                                duration: float, layer: int) -> None:
+        """Request a run of consecutive pixels on a trail in a single array write.
+        
+        Args:
+            start: The logical position of the first LED.
+            count: Number of consecutive LEDs to set.
+            color: The Pygame Color for the LEDs.
+            trail_type: The type of trail (TARGET, HIT, or FIFTH_LINE).
+            duration: Duration (in seconds) for the pixels to remain on. If -1, the pixels remain until overridden.
+                    Must be either -1 (permanent) or > 0 (fading).
+            layer: The layer to set the pixels on.
+        """
+        # Use a slice unless the run wraps around the end of the LED strip
+        start = start % self.led_count
+        if start + count <= self.led_count:
+            positions = slice(start, start + count)
+        else:
+            positions = np.arange(start, start + count) % self.led_count
+            
+        self._request_pixels_on_trail(positions, [color.r, color.g, color.b], trail_type, duration, layer)
+
     def set_target_trail_pixel(self, pos: int, color: Color, duration: float, layer: int) -> None:
         """Set pixel color at position in target ring with an optional duration.
         
@@ -447,6 +562,17 @@ class DisplayManager:
         """
         self._request_pixel_on_trail(pos, color, TrailType.TARGET, duration, layer)
     
+    def set_target_trail_pixels(self, positions: np.ndarray, colors: np.ndarray, duration: float, layer: int) -> None:
+        """Set many pixels in the target ring at once.
+        
+        Args:
+            positions: Integer array of logical LED positions.
+            colors: RGB values, either one [r, g, b] for all positions or an array of shape (len(positions), 3).
+            duration: Duration (in seconds) for the pixels to remain on. If -1, the pixels remain until overridden.
+            layer: The layer to set the pixels on.
+        """
+        self._request_pixels_on_trail(positions % self.led_count, colors, TrailType.TARGET, duration, layer)
+
     def set_hit_trail_pixel(self, pos: int, color: Color, duration: float) -> None:
         """Set pixel color at position in hit trail ring with specified duration.
         
@@ -457,6 +583,33 @@ class DisplayManager:
         """
         self._request_pixel_on_trail(pos, color, TrailType.HIT, duration, 0)
 
+    def set_hit_trail_pixels(self, positions: np.ndarray, colors: np.ndarray, duration: float) -> None:
+        """Set many pixels in the hit trail ring at once.
+        
+        Args:
+            positions: Integer array of logical LED positions.
+            colors: RGB values, either one [r, g, b] for all positions or an array of shape (len(positions), 3).
+            duration: Duration (in seconds) for the pixels to remain on. If -1, the pixels remain until overridden.
+        """
+        self._request_pixels_on_trail(positions % self.led_count, colors, TrailType.HIT, duration, 0)
+
+    def set_hit_trail_range(self, start: int, count: int, color: Color, duration: float) -> None:
+        """Set a run of consecutive pixels in the hit trail ring to the same color.
+        
+        Args:
+            start: The logical position of the first LED.
+            count: Number of consecutive LEDs to set.
+            color: The Pygame Color for the LEDs.
+            duration: Duration (in seconds) for the pixels to remain on. If -1, the pixels remain until overridden.
+        """
+        self._request_range_on_trail(start, count, color, TrailType.HIT, duration, 0)
+
+    def clear_hit_trail(self) -> None:
+        """Turn off every pixel in the hit trail ring with a single array fill."""
+        trail_idx = TrailType.HIT.value
+        self._active_colors_np[trail_idx] = 0
+        self._active_times_np[trail_idx] = -1.0
+
     def set_fifth_line_pixel(self, pos: int, color: Color, duration: float, layer: int) -> None:
         """Set pixel color for the fifth line LED chain with optional duration.
         
@@ -470,6 +623,20 @@ class DisplayManager:
             raise ValueError(f"Position must be between 0 and {self.led_count-1}")
         self._request_pixel_on_trail(pos, color, TrailType.FIFTH_LINE, duration, layer)
 
+    def set_fifth_line_range(self, start: int, count: int, color: Color, duration: float, layer: int) -> None:
+        """Set a run of consecutive pixels on the fifth line LED chain to the same color.
+        
+        Args:
+            start: First position in the fifth line chain (0 to led_count-1)
+            count: Number of consecutive LEDs to set; the run must end within the chain
+            color: The Pygame Color for the LEDs
+            duration: Duration (in seconds) for the pixels to remain on. If -1, the pixels remain until overridden.
+            layer: The layer to set the pixels on.
+        """
+        if start < 0 or start + count > self.led_count:
+            raise ValueError(f"Positions must be between 0 and {self.led_count-1}")
+        self._request_range_on_trail(start, count, color, TrailType.FIFTH_LINE, duration, layer)
+
     def cleanup(self) -> None:
         """Clean up display resources."""
         if hasattr(self.display, 'cleanup'):
@@ -10,7 +10,6 @@ from enum import Enum, auto
 from typing import Optional
 import pygame
 from pygame import Color
-import easing_functions
 import random
 
 from game_constants import (
@@ -23,6 +22,17 @@ from display_manager import DisplayManager
 WINDOW_SIZE_PERCENT_BEFORE = 0.10
 WINDOW_SIZE_PERCENT_AFTER = 0.20
 WINDOW_SIZE_LEDS_BEFORE = int(150*WINDOW_SIZE_PERCENT_BEFORE)
+_BLACK = Color(0, 0, 0)
+
+def _quad_ease_in_out(t: float) -> float:
+    """Closed-form quadratic ease-in-out over t in [0, 1].
+    
+    Matches easing_functions.QuadEaseInOut(start=0.0, end=1.0, duration=1.0)
+    without constructing an easing object every frame.
+    """
+    if t < 0.5:
+        return 2 * t * t
+    return -2 * t * t + 4 * t - 1
 
 # Sparkle effect constants
 SPARKLE_COLORS = [
@@ -68,6 +78,8 @@ class FifthLineTarget:
         target_hit_registered: Whether a hit has been registered for the target
         state: Current state of the target (NO_TARGET, PRE_WINDOW, IN_WINDOW, POST_WINDOW)
     """
+
+    __slots__ = ('_target_beat', 'target_hit_registered', 'state', 'penalty_applied', '_last_debug_str')
     
     @staticmethod
     def should_start_fifth_line(measure: int) -> bool:
@@ -161,7 +173,7 @@ class FifthLineTarget:
         if percent_complete >= 1.0:
             brightness = 1 - min(1.0, (percent_complete - 1.0) * 2)
             if brightness <= 0:
-                return Color(0, 0, 0)  # Fully transparent
+                return _BLACK  # Fully transparent
             return Color(
                 int(base_color.r * brightness),
                 int(base_color.g * brightness),
@@ -177,33 +189,28 @@ class FifthLineTarget:
             display: The display manager instance to draw on.
             percent_complete: The completion percentage of the animation (0.0 to 1.5).
         """
-        FIFTH_LINE_EASE = easing_functions.QuadEaseInOut(start=0.0, end=1.0, duration=1.0)
-        
         # Calculate position with easing, capped at 1.0 for the animation
-        eased = FIFTH_LINE_EASE.ease(min(percent_complete, 1.0))
+        eased = _quad_ease_in_out(min(percent_complete, 1.0))
         position = int(eased * (display.led_count - WINDOW_SIZE_LEDS_BEFORE))
         
         # A fifth line can only be considered "hit" if it was hit while in the valid window
         was_hit = self.state == TargetState.IN_WINDOW and self.target_hit_registered
         color = self.get_fifth_line_color(percent_complete, was_hit)
-        if color == Color(0, 0, 0):  # Fully transparent
+        if color == _BLACK:  # Fully transparent
             return
 
         # start = max(0, position - 20)
         start = position
         end = position + 1
         if percent_complete >= 1.0 - WINDOW_SIZE_PERCENT_BEFORE:
-            for i in range(position, display.led_count):
-                # duration *= 0.5
-                display.set_fifth_line_pixel(i, Color(255, 165, 0) if was_hit else Color(255, 255, 255), 0.5, 0)
+            display.set_fifth_line_range(position, display.led_count - position,
+                                         Color(255, 165, 0) if was_hit else Color(255, 255, 255), 0.5, 0)
         # Redraw the entire fifth line if it was hit
         if was_hit:
             start = 0
         duration = 0.5
-        
-        for i in range(start, end):
-            # duration *= 0.5
-            display.set_fifth_line_pixel(i, color, duration, 0)
+
+        display.set_fifth_line_range(start, end - start, color, duration, 0)
         
         display.set_fifth_line_pixel(display.led_count - 1, Color(255, 165, 0), 1.0, 0)
         display.set_fifth_line_pixel(display.led_count - WINDOW_SIZE_LEDS_BEFORE, Color(255, 165, 0), 1.0, 0)
@@ -218,8 +225,7 @@ class FifthLineTarget:
         Args:
             display: The display manager instance to draw on.
         """
-        for i in range(12):
-            display.set_fifth_line_pixel(display.led_count - 1 - i, Color(255, 165, 0), 0.2, 0)
+        display.set_fifth_line_range(display.led_count - 12, 12, Color(255, 165, 0), 0.2, 0)
     
     def update(self, display: DisplayManager, beat_float: float) -> None:
         """Update and draw the fifth line animation if one is active.
@@ -1,6 +1,7 @@
 """Game constants for the rhythm game."""
 
 from enum import Enum, auto
+import numpy as np
 from pygame import Color
 import easing_functions
 
@@ -86,12 +87,10 @@ class TargetType(Enum):
         Returns:
             The next TargetType in the cycle, wrapping back to RED after YELLOW
         """
-        # Get list of all target types in order
-        types = list(TargetType)
-        # Find current index
-        current_idx = types.index(self)
-        # Return next type, wrapping around to start
-        return types[(current_idx + 1) % len(types)]
+        return _NEXT_TARGET_TYPE[self.value]
+
+# Successor of each target type in declaration order, indexed by TargetType.value
+_NEXT_TARGET_TYPE = tuple(TargetType((t.value + 1) % len(TargetType)) for t in TargetType)
 
 # Target colors
 TARGET_COLORS = {
@@ -100,3 +99,13 @@ TARGET_COLORS = {
     TargetType.GREEN: Color(0, 255, 0),
     TargetType.YELLOW: Color(255, 255, 0)
 }
+
+# Target colors as a (len(TargetType), 3) uint8 RGB table, indexed by TargetType.value
+TARGET_COLORS_ARR = np.array(
+    [[TARGET_COLORS[t].r, TARGET_COLORS[t].g, TARGET_COLORS[t].b] for t in TargetType], dtype=np.uint8
+)
+
+# Target colors faded to every brightness byte, indexed by [TargetType.value, brightness * 255]
+TARGET_COLORS_FADED = (
+    TARGET_COLORS_ARR[:, None, :].astype(np.uint16) * np.arange(256, dtype=np.uint16)[None, :, None] // 255
+).astype(np.uint8)
@@ -1,38 +1,37 @@
 import asyncio
 import logging
-import pygame
-from typing import Callable
+from typing import Callable, Optional
 
 class Clock:
-    def __init__(self, time_func: Callable=pygame.time.get_ticks) -> None:
-        self.time_func = time_func
-        self.last_tick = time_func() or 0
+    def __init__(self) -> None:
+        self.next_deadline: Optional[float] = None
 
     async def tick(self, fps=0) -> None:
         if 0 >= fps:
             return
 
-        end_time = (1.0 / fps) * 1000
-        current = self.time_func()
-        time_diff = current - self.last_tick
-        delay = (end_time - time_diff) / 1000
-
-        self.last_tick = current
-        if delay < 0:
-            delay = 0
+        # Sleep until an absolute deadline on the event loop's monotonic clock so
+        # that per-frame rounding does not accumulate into drift.
+        frame_s = 1.0 / fps
+        now = asyncio.get_running_loop().time()
+        if self.next_deadline is None or now - self.next_deadline > frame_s:
+            # First frame, or we fell more than a frame behind: resync rather than
+            # running a burst of zero-delay frames to catch up.
+            self.next_deadline = now + frame_s
+        else:
+            self.next_deadline += frame_s
 
-        await asyncio.sleep(delay)
+        await asyncio.sleep(max(0.0, self.next_deadline - now))
 
 class EventEngine:
     def __init__(self) -> None:
         self.listeners: dict[str, list[Callable]] = {}
 
     def on(self, event: str) -> Callable:
-        if event not in self.listeners:
-            self.listeners[event] = []
+        listeners = self.listeners.setdefault(event, [])
 
         def wrapper(func, *args):
-            self.listeners[event].append(func)
+            listeners.append(func)
             return func
 
         return wrapper
@@ -47,9 +46,10 @@ class EventEngine:
     # which we then trust to run eventually
     async def async_trigger(self, event, *args, **kwargs):
         logging.info(f"async_trigger: {event}")
-        if event in self.listeners:
+        listeners = self.listeners.get(event)
+        if listeners is not None:
             # print(f"in list: {event}")
-            handlers = [func(*args, **kwargs) for func in self.listeners[event]]
+            handlers = [func(*args, **kwargs) for func in listeners]
 
             # schedule all listeners to run
             return await asyncio.gather(*handlers)
@@ -3,6 +3,7 @@
 This module provides a rainbow display visualization that lights up
 all LEDs in a rainbow pattern during autopilot mode.
 """
+import numpy as np
 from pygame import Color, time
 from display_manager import DisplayManager
 import random
@@ -21,6 +22,11 @@ PIXELS_PER_SWATH = 4
 
 class RainbowTrailDisplay:
     """A display implementation that shows all LEDs in rotating game colors."""
+
+    __slots__ = (
+        'display', 'led_count', 'last_update_ms', 'current_offset', 'colors', 'pixels_per_color',
+        '_pattern_rgb', '_led_indices', '_strip_rgb'
+    )
     
     def __init__(self, display: DisplayManager, led_count: int) -> None:
         """Initialize the rainbow trail display.
@@ -46,6 +52,17 @@ class RainbowTrailDisplay:
         # Each color gets 4 pixels
         self.pixels_per_color = 4
         
+        # RGB table of the repeating pattern and the LED indices it is laid over
+        self._pattern_rgb = np.array(
+            [[color.r, color.g, color.b] for color in self.get_current_colors()], dtype=np.uint8
+        )
+        self._led_indices = np.arange(led_count)
+        
+        # The pattern tiled over the strip plus one extra period, so any rotation
+        # of it is a plain slice
+        pattern_length = len(self._pattern_rgb)
+        self._strip_rgb = self._pattern_rgb[np.arange(led_count + pattern_length) % pattern_length]
+        
     def get_current_colors(self) -> List[Color]:
         """Get the current color sequence.
         
@@ -71,6 +88,19 @@ class RainbowTrailDisplay:
         """
         pass
 
+    def set_range(self, start: int, count: int, color: Color, duration: float) -> None:
+        """Set a run of consecutive pixels in the display.
+        
+        In rainbow mode this is ignored, just like set_pixel.
+        
+        Args:
+            start: First position to set (ignored)
+            count: Number of positions to set (ignored)
+            color: Color to set (ignored)
+            duration: Duration for the pixels (ignored)
+        """
+        pass
+
     def clear(self) -> None:
         """Clear the display."""
         pass
@@ -85,16 +115,11 @@ class RainbowTrailDisplay:
             self.current_offset = (self.current_offset + 1) % len(self.colors)
             self.last_update_ms = current_time_ms
             
-        # Get the current sequence of colors
-        colors = self.get_current_colors()
-        total_pattern_length = len(colors)
+        # The rotated pattern for the whole strip is a view into the tiled table;
+        # current_offset is kept wrapped, so the start is always within one period
+        start = self.current_offset * self.pixels_per_color
+        rgb = self._strip_rgb[start:start + self.led_count]
         
-        # Update both hit trail and target trail pixels
-        for i in range(self.led_count):
-            # Calculate color index with offset and wrap around
-            color_idx = (i + self.current_offset * self.pixels_per_color) % total_pattern_length
-            color = colors[color_idx]
-            
-            # Update both trails with the same rainbow pattern
-            self.display.set_hit_trail_pixel(i, color, 1.0)  # Layer 0 for hit trail
-            self.display.set_target_trail_pixel(i, color, 1.0, 0)  # Layer 0 for target trail 
\ No newline at end of file
+        # Update both trails with the same rainbow pattern
+        self.display.set_hit_trail_pixels(self._led_indices, rgb, 1.0)  # Layer 0 for hit trail
+        self.display.set_target_trail_pixels(self._led_indices, rgb, 1.0, 0)  # Layer 0 for target trail
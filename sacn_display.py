@@ -108,10 +108,8 @@ class SacnDisplay:
         self.dmx_data[addr + 1] = color.g
         self.dmx_data[addr + 2] = color.b
         
-        # Mark affected universe as changed
-        universe = (addr // (LEDS_PER_UNIVERSE * 3)) + 1
-        if universe in self.changed_universes:
-            self.changed_universes[universe] = True
+        # Mark affected universe as changed (every universe is pre-populated in __init__)
+        self.changed_universes[(addr // (LEDS_PER_UNIVERSE * 3)) + 1] = True
         
     def set_fifth_line_pixel(self, pos: int, color: Color, trail_start_offset: int) -> None:
         """Set a pixel on the fifth line.
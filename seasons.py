@@ -8,6 +8,7 @@ import sys
 from typing import List, Optional, Tuple, Dict
 
 import aiohttp
+import numpy as np
 import pygame
 from pygame import Color
 from pygameasync import Clock
@@ -80,13 +81,19 @@ quit_app = False
 
 class GameState:
     """Manages game state and timing."""
+
+    __slots__ = (
+        'number_of_leds', 'button_handler', 'beat_start_time_ms',
+        'http_session', 'audio_manager', 'start_ticks_ms', 'wled_manager', 'trail_state_manager',
+        'current_led_position', 'fifth_line_targets', 'fifth_line_button',
+        'fifth_line_pressed', 'music_started', 'last_hit_time', 'display', 'default_display',
+        'rainbow_display', 'hit_trail'
+    )
     
     def __init__(self) -> None:
         # Store LED configuration
         self.number_of_leds = args.leds
         
-        self.next_loop: int = 1
-        self.loop_count: int = 0
         self.button_handler = ButtonHandler(
             number_of_leds=self.number_of_leds,
             auto_score=args.auto_score
@@ -104,12 +111,9 @@ class GameState:
         self.wled_manager = WLEDManager(not args.disable_wled, QUAD_HOSTNAME, self.http_session, number_of_leds=self.number_of_leds//2)
         
         # Trail state manager (replaces individual trail state variables)
-        self.trail_state_manager = TrailStateManager()
+        self.trail_state_manager = TrailStateManager(self.number_of_leds)
         self.current_led_position: Optional[int] = None  # Track current LED position
         
-        # Track miss timestamps for fade effect
-        self.miss_timestamps: Dict[Tuple[int, TargetType], Tuple[float, float]] = {}  # (position, target_type) -> (timestamp, initial_intensity)
-        
         # Fifth line target array
         self.fifth_line_targets: List[FifthLineTarget] = []
 
@@ -186,20 +190,14 @@ class GameState:
             misses: List of target types that were missed
             display: Display manager instance to draw on
         """        
+        offsets = np.arange(-max_distance, max_distance + 1)
+        # Distance-based intensity using quadratic ease out
+        distance = np.abs(offsets) / max_distance
+        initial_intensity = 1.0 - (distance ** 2)
         for target_miss in misses:
             error_pos = self.button_handler.target_positions[target_miss]
-            for offset in range(-max_distance, max_distance + 1):
-                pos = error_pos + offset
-
-                # Calculate distance-based intensity using quadratic ease out
-                distance = abs(offset) / max_distance
-                initial_intensity = 1.0 - (distance ** 2)  # Quadratic ease out
-                faded_color = Color(
-                    int(TARGET_COLORS[target_miss].r * initial_intensity),
-                    int(TARGET_COLORS[target_miss].g * initial_intensity),
-                    int(TARGET_COLORS[target_miss].b * initial_intensity)
-                )
-                display.set_target_trail_pixel(pos, faded_color, 0.5, 0)
+            faded_colors = (TARGET_COLORS_ARR[target_miss.value] * initial_intensity[:, None]).astype(np.uint8)
+            display.set_target_trail_pixels(error_pos + offsets, faded_colors, 0.5, 0)
 
     def handle_hits(self, hits: List[TargetType], hit_trail: 'SimpleHitTrail', display: DisplayManager, add_hit: bool = True) -> None:
         """Handle successful hits and update score.
@@ -212,15 +210,15 @@ class GameState:
         """
         for target_hit in hits:
             # Light up LEDs within the target window
-            target_color = TARGET_COLORS[target_hit]
             target_pos = self.button_handler.target_positions[target_hit]
-            window_start, window_end = self.button_handler.get_window_boundaries(target_pos, hit_trail.hits_by_type, target_hit)
+            window_start, window_end = self.button_handler.get_window_boundaries(target_pos, hit_trail.hit_counts, target_hit)
             
             if window_start > window_end:
                 window_end += self.button_handler.number_of_leds
                 
-            for i in range(window_start, window_end + 1):
-                display.set_target_trail_pixel(i % self.button_handler.number_of_leds, target_color, 1.0, 1)
+            display.set_target_trail_pixels(
+                np.arange(window_start, window_end + 1), TARGET_COLORS_ARR[target_hit.value], 1.0, 1
+            )
     
             if add_hit:
                 hit_trail.add_hit(target_hit)
@@ -277,18 +275,19 @@ async def run_game() -> None:
     logger.info(f"Created hit trail with {game_state.hit_trail.total_hits} total hits")
     
     try:
-        # Handle key press mapping
-        key_mapping = {
-            "r": TargetType.RED,
-            "g": TargetType.GREEN,
-            "b": TargetType.BLUE,
-            "y": TargetType.YELLOW,
-            " ": None  # Space bar for fifth line
-        }
-
         last_beat = -1
         stable_score = 0
         current_phrase = 0
+
+        # Bind loop-invariant objects to locals to avoid attribute lookups every frame
+        button_handler = game_state.button_handler
+        hit_trail = game_state.hit_trail
+        trail_state_manager = game_state.trail_state_manager
+        fifth_line_targets = game_state.fifth_line_targets
+        target_windows = [
+            (target_type, target_pos, TARGET_COLORS[target_type])
+            for target_type, target_pos in button_handler.target_positions.items()
+        ]
         while True:
             display.clear()
             current_time_ms: int = pygame.time.get_ticks()
@@ -309,32 +308,31 @@ async def run_game() -> None:
                     display.cleanup()  # Clean up display before exiting
                     return
 
-            valid_targets = [t for t in game_state.fifth_line_targets if t.is_in_valid_window()]
+            valid_targets = [t for t in fifth_line_targets if t.is_in_valid_window()]
             if valid_targets and (fifth_line_pressed or args.auto_score):
                 for target in valid_targets:
                     target.register_hit()
             elif fifth_line_pressed:
                 FifthLineTarget.handle_fifth_line_miss(display)
 
-            # Update all fifth line targets and remove completed ones
-            for target in game_state.fifth_line_targets[:]:  # Create copy of list for safe removal
+            # Update all fifth line targets, then compact out completed ones in place
+            for target in fifth_line_targets:
                 target.update(display, beat_float)
                 # Check for penalties
                 if current_phrase < AUTOPILOT_PHRASE and target.check_penalties():
                     # Remove half of all hits as penalty for missing fifth line target
-                    game_state.hit_trail.remove_half_hits()
+                    hit_trail.remove_half_hits()
                     print("----------------Score penalty: Missed fifth line target")
-                if target.state == TargetState.NO_TARGET:
-                    game_state.fifth_line_targets.remove(target)
+            fifth_line_targets[:] = [t for t in fifth_line_targets if t.state != TargetState.NO_TARGET]
 
             if last_beat != int(beat_float):
                 last_beat = int(beat_float)
-                print(f"beat_in_phrase: {beat_in_phrase}, beat_float: {beat_float}")
+                logger.debug("beat_in_phrase: %s, beat_float: %s", beat_in_phrase, beat_float)
                 
                 # print(f"Updating WLED {stable_score}, hit_trail.get_score(): {hit_trail.get_score()}")
                 await game_state.wled_manager.update_wled(int(stable_score*2))
 
-                print(f"music_started: {game_state.music_started}, args.auto_score: {args.auto_score}")
+                logger.debug("music_started: %s, args.auto_score: %s", game_state.music_started, args.auto_score)
                 if beat_in_phrase == 0:
                     if game_state.music_started:
                         if current_time_ms - game_state.last_hit_time > 30000:
@@ -345,7 +343,7 @@ async def run_game() -> None:
                             if current_phrase < AUTOPILOT_PHRASE:
                                 game_state.handle_music_loop(int(stable_score), current_time_ms)
                             else:
-                                game_state.hit_trail.trail_display = game_state.rainbow_display
+                                hit_trail.trail_display = game_state.rainbow_display
                     elif game_state.last_hit_time > 0 or args.auto_score:
                         game_state.audio_manager.play_music(start_pos_s=0.0)
                         game_state.start_ticks_ms = current_time_ms
@@ -356,42 +354,42 @@ async def run_game() -> None:
                 if beat_in_phrase in (0, 4):  # Check for both start and middle of phrase
                     measure = current_phrase * 2 + (1 if beat_in_phrase == 4 else 0)
                     if FifthLineTarget.should_start_fifth_line(measure):
-                        game_state.fifth_line_targets.append(FifthLineTarget(measure))
+                        fifth_line_targets.append(FifthLineTarget(measure))
 
             led_position: int = LEDPosition.calculate_position(beat_in_phrase, fractional_beat, game_state.number_of_leds)
             
-            game_state.button_handler.reset_flags(led_position)
+            button_handler.reset_flags(led_position)
             
-            hits, misses = game_state.button_handler.handle_keypress(led_position)
+            hits, misses = button_handler.handle_keypress(led_position)
             
-            game_state.handle_hits(hits, game_state.hit_trail, display, game_state.music_started)
+            game_state.handle_hits(hits, hit_trail, display, game_state.music_started)
             game_state.handle_misses(misses, 8, display)
             
             if hits or misses or fifth_line_pressed:
                 game_state.last_hit_time = current_time_ms
             
             # Update stable_score only when outside a scoring window
-            if not game_state.button_handler.is_in_valid_window(led_position):
+            if not button_handler.is_in_valid_window(led_position):
                 if game_state.music_started and not pygame.mixer.music.get_busy():
                     game_state.stop_music_and_reset()
-                stable_score = game_state.hit_trail.get_score()
+                stable_score = hit_trail.get_score()
                 
             if led_position != game_state.current_led_position:
                 game_state.current_led_position = led_position
                 # Store the timestamp and base white color for the new position
-                game_state.trail_state_manager.update_position(led_position, current_time_ms / MS_PER_SEC)
+                trail_state_manager.update_position(led_position, current_time_ms / MS_PER_SEC)
             
             # Update display state
-            game_state.hit_trail.trail_display.update()
+            hit_trail.trail_display.update()
             
             # Draw LEDs at the start and end of each target window
-            for target_type, target_pos in game_state.button_handler.target_positions.items():
-                window_start, window_end = game_state.button_handler.get_window_boundaries(target_pos, game_state.hit_trail.hits_by_type, target_type)
-                display.set_target_trail_pixel(window_start, TARGET_COLORS[target_type], 0.5, 0)
-                display.set_target_trail_pixel(window_end, TARGET_COLORS[target_type], 0.5, 0)
+            for target_type, target_pos, target_color in target_windows:
+                window_start, window_end = button_handler.get_window_boundaries(target_pos, hit_trail.hit_counts, target_type)
+                display.set_target_trail_pixel(window_start, target_color, 0.5, 0)
+                display.set_target_trail_pixel(window_end, target_color, 0.5, 0)
 
             display.set_target_trail_pixel(led_position, Color(255, 255, 255), 0.3, 0)
-            display.draw_score_lines(game_state.hit_trail.get_score())
+            display.draw_score_lines(hit_trail.get_score())
                         
             display.update()
             await clock.tick(30)
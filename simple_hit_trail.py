@@ -3,22 +3,35 @@
 This module provides a simplified hit trail visualization where each hit
 simply lights up the closest LED, rather than creating a trailing effect.
 """
-import pygame
-from typing import Dict, Tuple, Optional, List, Protocol
+import logging
+from typing import Tuple, Optional, List, Protocol
 from pygame import Color
 from game_constants import TargetType, TARGET_COLORS
 from display_manager import DisplayManager
 
+logger = logging.getLogger(__name__)
+
 LEDS_PER_HIT = 4
+HITS_PER_SCORE_POINT = 4
+_SCORE_SCALE = 1.0 / HITS_PER_SCORE_POINT  # Exact for a power of two, so scores are unchanged
+_BLACK = Color(0, 0, 0)
+
+_TARGET_TYPES: Tuple[TargetType, ...] = tuple(TargetType)  # Indexed by TargetType.value
+_TARGET_COLORS_BY_VALUE: Tuple[Color, ...] = tuple(TARGET_COLORS[t] for t in _TARGET_TYPES)
+_NUM_TARGETS = len(_TARGET_TYPES)
+_ALL_TARGETS_MASK = (1 << _NUM_TARGETS) - 1
 
 class TrailDisplay(Protocol):
     """Protocol for trail display implementations."""
     def set_pixel(self, position: int, color: Color, duration: float) -> None: ...
+    def set_range(self, start: int, count: int, color: Color, duration: float) -> None: ...
     def clear(self) -> None: ...
     def update(self) -> None: ...
 
 class DefaultTrailDisplay:
     """Default display implementation that shows individual pixels."""
+
+    __slots__ = ('display', 'led_count')
     
     def __init__(self, display: DisplayManager, led_count: int) -> None:
         """Initialize the default trail display.
@@ -40,10 +53,20 @@ class DefaultTrailDisplay:
         """
         self.display.set_hit_trail_pixel(position, color, duration)
 
+    def set_range(self, start: int, count: int, color: Color, duration: float) -> None:
+        """Set a run of consecutive pixels in the display.
+        
+        Args:
+            start: First position to set
+            count: Number of consecutive positions to set
+            color: Color to set
+            duration: Duration for the pixels
+        """
+        self.display.set_hit_trail_range(start, count, color, duration)
+
     def clear(self) -> None:
         """Clear the display."""
-        for i in range(self.led_count):
-            self.display.set_hit_trail_pixel(i, Color(0, 0, 0), -1)
+        self.display.clear_hit_trail()
 
     def update(self) -> None:
         """Update the display state. No-op for default display."""
@@ -51,6 +74,11 @@ class DefaultTrailDisplay:
 
 class SimpleHitTrail:
     """A simple hit trail implementation that lights up a single LED position."""
+
+    __slots__ = (
+        'led_count', 'max_hits', 'max_hits_per_target', '_target_base_pos', 'trail_display',
+        'hit_counts', 'total_hits', '_full_mask'
+    )
     
     def __init__(self, display: DisplayManager, led_count: int, trail_display: Optional[TrailDisplay] = None) -> None:
         """Initialize the simple hit trail.
@@ -63,18 +91,23 @@ class SimpleHitTrail:
         self.led_count = led_count
         self.max_hits = led_count // LEDS_PER_HIT
         self.max_hits_per_target = self.max_hits // 4
+        # First hit slot of each target type's section of the trail, indexed by TargetType.value
+        self._target_base_pos: List[int] = [
+            target_type.value * self.max_hits_per_target for target_type in TargetType
+        ]
         self.trail_display = trail_display or DefaultTrailDisplay(display, led_count)
+        # Hits per target type, indexed by TargetType.value. Each type's hits fill its
+        # section from _target_base_pos upward, so positions follow from the count alone
+        self.hit_counts: List[int] = [0] * _NUM_TARGETS
         self._initialize_state()
 
     def _initialize_state(self) -> None:
         """Initialize or reset the hit trail state variables."""
-        self.number_of_hits_by_type: Dict[TargetType, int] = {
-            target_type: 0 for target_type in TargetType
-        }
-        self.hits_by_type: Dict[TargetType, List[int]] = {
-            target_type: [] for target_type in TargetType
-        }
+        # The trail itself is blanked with a single clear() below rather than hit by hit
+        self.hit_counts[:] = [0] * _NUM_TARGETS
         self.total_hits: int = 0
+        # Bit TargetType.value is set while that target's section of the trail is full
+        self._full_mask: int = 0 if self.max_hits_per_target else _ALL_TARGETS_MASK
         self.trail_display.clear()
 
     def reset(self) -> None:
@@ -87,7 +120,7 @@ class SimpleHitTrail:
         Returns:
             Current score value
         """
-        return self.total_hits / 4.0
+        return self.total_hits * _SCORE_SCALE
 
     def add_hit(self, target_type: TargetType) -> None:
         """Add a hit to the trail.
@@ -95,19 +128,23 @@ class SimpleHitTrail:
         Args:
             target_type: Type of target that was hit
         """
-        print(f"adding hit for target_type: {target_type}")
+        logger.debug("adding hit for target_type: %s", target_type)
         self.total_hits += 1
-        targets_tried = 0
-        while self.number_of_hits_by_type[target_type] >= self.max_hits_per_target:
-            target_type = target_type.next()
-            targets_tried += 1
-            if targets_tried > 4:
-                return
-
-        target_position = target_type.value * self.max_hits_per_target + self.number_of_hits_by_type[target_type]
-        self.number_of_hits_by_type[target_type] += 1
-        self._set_leds(target_position, TARGET_COLORS[target_type])
-        self.hits_by_type[target_type].append(target_position)
+        not_full = ~self._full_mask & _ALL_TARGETS_MASK
+        if not not_full:
+            return
+
+        # Overflow to the next target section (in TargetType.next() order) that has room:
+        # rotate the mask so the requested type is bit 0 and take the lowest set bit
+        start = target_type.value
+        rotated = ((not_full >> start) | (not_full << (_NUM_TARGETS - start))) & _ALL_TARGETS_MASK
+        type_idx = (start + (rotated & -rotated).bit_length() - 1) % _NUM_TARGETS
+
+        count = self.hit_counts[type_idx]
+        self._set_leds(self._target_base_pos[type_idx] + count, _TARGET_COLORS_BY_VALUE[type_idx])
+        self.hit_counts[type_idx] = count = count + 1
+        if count == self.max_hits_per_target:
+            self._full_mask |= 1 << type_idx
     
     def remove_hit(self, target_type: TargetType) -> None:
         """Remove a hit of the specified target type from the hit trail.
@@ -115,10 +152,13 @@ class SimpleHitTrail:
         Args:
             target_type: Type of target to remove
         """
-        if self.hits_by_type[target_type]:
-            target_position = self.hits_by_type[target_type].pop()
-            self._set_leds(target_position, Color(0, 0, 0))
-            self.number_of_hits_by_type[target_type] -= 1
+        type_idx = target_type.value
+        count = self.hit_counts[type_idx]
+        if count:
+            count -= 1
+            self.hit_counts[type_idx] = count
+            self._full_mask &= ~(1 << type_idx)
+            self._set_leds(self._target_base_pos[type_idx] + count, _BLACK)
             self.total_hits = max(0, self.total_hits - 1)
 
     def _set_leds(self, target_position: int, color: Color) -> None:
@@ -128,17 +168,24 @@ class SimpleHitTrail:
             target_position: Position to set
             color: Color to set
         """
-        for x in range(LEDS_PER_HIT):
-            self.trail_display.set_pixel(target_position*LEDS_PER_HIT + x, color, -1)
+        self.trail_display.set_range(target_position*LEDS_PER_HIT, LEDS_PER_HIT, color, -1)
 
     def remove_half_hits(self) -> None:
         """Remove half of the hits for each target type."""
-        for target_type in TargetType:
-            hits = self.hits_by_type[target_type]
-            hits_to_remove = len(hits) // 2  # Integer division to remove half
+        for type_idx, count in enumerate(self.hit_counts):
+            hits_to_remove = count // 2  # Integer division to remove half
+            if not hits_to_remove:
+                continue
             
-            # Remove the most recent hits
-            for _ in range(hits_to_remove):
-                self.remove_hit(target_type)
+            # The most recent hits occupy one contiguous run of positions at the top of
+            # the section, so blank them with a single range write
+            remaining = count - hits_to_remove
+            first_removed = self._target_base_pos[type_idx] + remaining
+            self.trail_display.set_range(
+                first_removed*LEDS_PER_HIT, hits_to_remove*LEDS_PER_HIT, _BLACK, -1
+            )
+            self.hit_counts[type_idx] = remaining
+            self._full_mask &= ~(1 << type_idx)
+            self.total_hits = max(0, self.total_hits - hits_to_remove)
         
-        print(f"Removed half of hits, new total: {self.total_hits}")
\ No newline at end of file
+        logger.debug("Removed half of hits, new total: %d", self.total_hits)
\ No newline at end of file
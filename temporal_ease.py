@@ -1,8 +1,13 @@
-from rpi_ws281x import PixelStrip, Color
-from easing_functions import QuadEaseOut
-import colorsys
+from rpi_ws281x import PixelStrip
+import numpy as np
 import time
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # --- Configuration ---
 LED_COUNT = 60
 LED_PIN = 18
@@ -16,16 +21,71 @@ TRAIL_FADE_DURATION_S = 1.5     # Time to fade out
 MOVE_INTERVAL_S = 0.04          # Time between head movements
 HUE_STEP = 3                  # Degrees hue changes per move
 
+def hsv_to_packed_rgb(hue_deg: np.ndarray, value: np.ndarray) -> np.ndarray:
+    """Vectorized fully saturated HSV to packed 0xRRGGBB, as rpi_ws281x.Color returns.
+
+    Same arithmetic as colorsys.hsv_to_rgb(h, 1.0, v) per element.
+    """
+    h6 = (hue_deg % 360) / 360.0 * 6.0
+    sector = h6.astype(np.int64)
+    f = h6 - sector
+    v = value
+    q = v * (1.0 - f)
+    t = v * f
+    zero = np.zeros_like(v)
+    sector %= 6
+    r = np.choose(sector, (v, q, zero, zero, t, v))
+    g = np.choose(sector, (t, v, v, q, zero, zero))
+    b = np.choose(sector, (zero, zero, t, v, v, q))
+    return ((r * 255).astype(np.int64) << 16) | ((g * 255).astype(np.int64) << 8) | (b * 255).astype(np.int64)
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _trail_kernel(lit_time_s: np.ndarray, lit_hue: np.ndarray, now_s: float,
+                      fade_s: float, inv_fade_s: float, out: np.ndarray) -> None:
+        """Expire, fade and colour the whole strip into out in a single pass.
+
+        Same arithmetic as the NumPy path in the main loop, without its temporaries.
+        """
+        for i in range(lit_time_s.shape[0]):
+            elapsed_s = now_s - lit_time_s[i]
+            if not elapsed_s <= fade_s:  # Also catches NaN (unlit)
+                lit_time_s[i] = np.nan
+                out[i] = 0
+                continue
+            v = 1.0 - elapsed_s * inv_fade_s
+            v *= v
+            h6 = (lit_hue[i] % 360) / 360.0 * 6.0
+            sector = int(h6)
+            f = h6 - sector
+            q = v * (1.0 - f)
+            t = v * f
+            sector %= 6
+            if sector == 0:
+                r, g, b = v, t, 0.0
+            elif sector == 1:
+                r, g, b = q, v, 0.0
+            elif sector == 2:
+                r, g, b = 0.0, v, t
+            elif sector == 3:
+                r, g, b = 0.0, q, v
+            elif sector == 4:
+                r, g, b = t, 0.0, v
+            else:
+                r, g, b = v, 0.0, q
+            out[i] = (int(r * 255) << 16) | (int(g * 255) << 8) | int(b * 255)
+
 # --- Setup ---
 strip = PixelStrip(LED_COUNT, LED_PIN, LED_FREQ_HZ, LED_DMA,
                    LED_INVERT, LED_BRIGHTNESS, LED_CHANNEL)
 strip.begin()
 
 # --- State ---
-lit_time_s = [None] * LED_COUNT
-lit_hue = [None] * LED_COUNT
+lit_time_s = np.full(LED_COUNT, np.nan)  # NaN marks an unlit LED
+lit_hue = np.zeros(LED_COUNT)
+packed_rgb = np.zeros(LED_COUNT, dtype=np.int64)  # Output buffer for the Numba kernel
 
-ease = QuadEaseOut(start=1.0, end=0.0, duration=TRAIL_FADE_DURATION_S)
+INV_TRAIL_FADE_DURATION_S = 1.0 / TRAIL_FADE_DURATION_S
 
 head = 0
 hue = 0
@@ -42,24 +102,21 @@ while True:
         hue = (hue + HUE_STEP) % 360
         last_move_time_s = now_s
 
-    # Update LED colors
-    for i in range(LED_COUNT):
-        if lit_time_s[i] is None:
-            strip.setPixelColor(i, Color(0, 0, 0))
-            continue
-
-        elapsed_s = now_s - lit_time_s[i]
-        if elapsed_s > TRAIL_FADE_DURATION_S:
-            lit_time_s[i] = None
-            lit_hue[i] = None
-            strip.setPixelColor(i, Color(0, 0, 0))
-        else:
-            brightness = ease.ease(elapsed_s)
-            h = (lit_hue[i] % 360) / 360.0
-            s = 1.0
-            v = brightness
-            r, g, b = colorsys.hsv_to_rgb(h, s, v)
-            strip.setPixelColor(i, Color(int(r * 255), int(g * 255), int(b * 255)))
+    # Update LED colors for the whole strip at once
+    if HAS_NUMBA:
+        _trail_kernel(lit_time_s, lit_hue, now_s, TRAIL_FADE_DURATION_S,
+                      INV_TRAIL_FADE_DURATION_S, packed_rgb)
+    else:
+        elapsed_s = now_s - lit_time_s
+        active = elapsed_s <= TRAIL_FADE_DURATION_S  # NaN compares False, so unlit LEDs stay dark
+        lit_time_s[~active] = np.nan
+
+        # Quadratic ease out from 1.0 to 0.0 over the fade duration
+        brightness = np.where(active, 1.0 - elapsed_s * INV_TRAIL_FADE_DURATION_S, 0.0)
+        brightness *= brightness
+        packed_rgb = hsv_to_packed_rgb(lit_hue, brightness)
+    for i, color in enumerate(packed_rgb.tolist()):
+        strip.setPixelColor(i, color)
 
     strip.show()
     time.sleep(0.01)
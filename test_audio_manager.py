@@ -13,8 +13,8 @@ class TestAudioManager(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         # Create a patch for pygame.mixer.music to avoid actual audio playback
-        self.mock_pygame_mixer_music = patch('pygame.mixer.music').start()
-        self.mock_pygame_time = patch('pygame.time').start()
+        self._patchers = [patch('pygame.mixer.music'), patch('pygame.time')]
+        self.mock_pygame_mixer_music, self.mock_pygame_time = [p.start() for p in self._patchers]
         
         # Set up mock return values
         self.mock_pygame_time.get_ticks.return_value = 1000  # 1 second in ms
@@ -25,7 +25,8 @@ class TestAudioManager(unittest.TestCase):
     
     def tearDown(self):
         """Tear down test fixtures."""
-        patch.stopall()
+        for patcher in reversed(self._patchers):
+            patcher.stop()
     
     def test_init(self):
         """Test initialization with default values."""
@@ -1,13 +1,75 @@
 """Unit tests for the ButtonHandler class."""
 
+import collections
 import unittest
-from unittest.mock import MagicMock, patch
+import numpy as np
+import pytest
+from unittest.mock import patch
 import pygame
 from pygame import Color
 
 from button_handler import ButtonHandler
 from game_constants import TargetType, TARGET_COLORS
 
+# Test ring layout shared by the parametrized position tests
+LED_COUNT = 80
+WINDOW_SIZE = 4
+MID_POS = 40  # 50% of LED_COUNT
+RIGHT_POS = 20  # 25% of LED_COUNT
+LEFT_POS = 60  # 75% of LED_COUNT
+
+
+@pytest.mark.parametrize("position, in_window", [
+    # Positions in each window
+    (0, True),
+    (LED_COUNT - 1, True),
+    (MID_POS, True),
+    (RIGHT_POS, True),
+    (LEFT_POS, True),
+    # Position at a window edge
+    (WINDOW_SIZE, True),
+    # Positions outside windows
+    (10, False),
+    (30, False),
+    (50, False),
+])
+def test_is_position_in_valid_window(position, in_window):
+    """Test the is_position_in_valid_window static method."""
+    target_type = ButtonHandler.get_target_type_for_position(
+        position, LED_COUNT, WINDOW_SIZE, MID_POS, RIGHT_POS, LEFT_POS)
+    assert (target_type is not None) == in_window
+
+
+@pytest.mark.parametrize("position, expected", [
+    # Positions in each target window
+    (0, TargetType.RED),
+    (LED_COUNT - 1, TargetType.RED),
+    (MID_POS, TargetType.BLUE),
+    (RIGHT_POS, TargetType.GREEN),
+    (LEFT_POS, TargetType.YELLOW),
+    # Position outside any window
+    (30, None),
+])
+def test_get_target_type_for_position(position, expected):
+    """Test the get_target_type_for_position static method."""
+    assert ButtonHandler.get_target_type_for_position(
+        position, LED_COUNT, WINDOW_SIZE, MID_POS, RIGHT_POS, LEFT_POS) == expected
+
+
+def test_positions_in_valid_window():
+    """Test the vectorized window check against the per-position lookup."""
+    button_handler = ButtonHandler(number_of_leds=LED_COUNT, auto_score=False)
+    positions = np.array([0, LED_COUNT - 1, MID_POS, RIGHT_POS, LEFT_POS,
+                          button_handler.target_window_size, 10, 30, 50])
+    expected = np.array([True, True, True, True, True, True, False, False, False])
+    assert np.array_equal(button_handler.positions_in_valid_window(positions), expected)
+    
+    all_positions = np.arange(LED_COUNT)
+    scalar = [button_handler.get_target_type_for_position(p, LED_COUNT, button_handler.target_window_size) is not None
+              for p in all_positions]
+    assert np.array_equal(button_handler.positions_in_valid_window(all_positions), scalar)
+
+
 class TestButtonHandler(unittest.TestCase):
     """Test cases for the ButtonHandler class."""
     
@@ -32,31 +94,12 @@ class TestButtonHandler(unittest.TestCase):
         self.button_handler.green_target_pos = self.right_pos
         self.button_handler.yellow_target_pos = self.left_pos
     
-    def test_is_position_in_valid_window(self):
-        """Test the is_position_in_valid_window static method."""
-        # Test positions in each window
-        self.assertIsNotNone(ButtonHandler.get_target_type_for_position(
-            0, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
-        self.assertIsNotNone(ButtonHandler.get_target_type_for_position(
-            self.led_count - 1, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
-        self.assertIsNotNone(ButtonHandler.get_target_type_for_position(
-            self.mid_pos, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
-        self.assertIsNotNone(ButtonHandler.get_target_type_for_position(
-            self.right_pos, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
-        self.assertIsNotNone(ButtonHandler.get_target_type_for_position(
-            self.left_pos, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
-        
-        # Test positions at window edges
-        self.assertIsNotNone(ButtonHandler.get_target_type_for_position(
-            self.window_size, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
+    def _stub(self, name, return_value):
+        """Replace a button handler method with a plain function returning return_value.
         
-        # Test positions outside windows
-        self.assertIsNone(ButtonHandler.get_target_type_for_position(
-            10, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
-        self.assertIsNone(ButtonHandler.get_target_type_for_position(
-            30, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
-        self.assertIsNone(ButtonHandler.get_target_type_for_position(
-            50, self.led_count, self.window_size, self.mid_pos, self.right_pos, self.left_pos))
+        The handler is rebuilt in setUp, so the instance attribute needs no restoring.
+        """
+        setattr(self.button_handler, name, lambda *args, **kwargs: return_value)
     
     def test_calculate_penalty_score(self):
         """Test the calculate_penalty_score static method."""
@@ -69,41 +112,6 @@ class TestButtonHandler(unittest.TestCase):
         self.assertEqual(ButtonHandler.calculate_penalty_score(1.75), 1.25)
         self.assertEqual(ButtonHandler.calculate_penalty_score(0.5), 0.25)
     
-    def test_get_target_type_for_position(self):
-        """Test the get_target_type_for_position static method."""
-        # Test positions in each target window
-        self.assertEqual(
-            ButtonHandler.get_target_type_for_position(0, self.led_count, self.window_size, 
-                                                      self.mid_pos, self.right_pos, self.left_pos),
-            TargetType.RED
-        )
-        self.assertEqual(
-            ButtonHandler.get_target_type_for_position(self.led_count - 1, self.led_count, self.window_size, 
-                                                      self.mid_pos, self.right_pos, self.left_pos),
-            TargetType.RED
-        )
-        self.assertEqual(
-            ButtonHandler.get_target_type_for_position(self.mid_pos, self.led_count, self.window_size, 
-                                                      self.mid_pos, self.right_pos, self.left_pos),
-            TargetType.BLUE
-        )
-        self.assertEqual(
-            ButtonHandler.get_target_type_for_position(self.right_pos, self.led_count, self.window_size, 
-                                                      self.mid_pos, self.right_pos, self.left_pos),
-            TargetType.GREEN
-        )
-        self.assertEqual(
-            ButtonHandler.get_target_type_for_position(self.left_pos, self.led_count, self.window_size, 
-                                                      self.mid_pos, self.right_pos, self.left_pos),
-            TargetType.YELLOW
-        )
-        
-        # Test position outside any window
-        self.assertIsNone(
-            ButtonHandler.get_target_type_for_position(30, self.led_count, self.window_size, 
-                                                     self.mid_pos, self.right_pos, self.left_pos)
-        )
-    
     def test_get_keys_for_target(self):
         """Test the get_keys_for_target static method."""
         # Test keys for each target type
@@ -125,40 +133,44 @@ class TestButtonHandler(unittest.TestCase):
         """Test handle_keypress with correct key press."""
         # Mock key press for red target
         keys_dict = {pygame.K_r: True}
-        mock_get_pressed.return_value = MagicMock(__getitem__=lambda _, key: keys_dict.get(key, False))
+        mock_get_pressed.return_value = collections.defaultdict(bool, keys_dict)
         
         # Test with position in red target window
-        with patch.object(self.button_handler, 'get_target_type', return_value=TargetType.RED):
-            successful_hit, target_hit = self.button_handler.handle_keypress(0, 1000)
-            self.assertEqual(successful_hit, True)
-            self.assertEqual(target_hit, TargetType.RED)
+        self._stub('get_target_type', TargetType.RED)
+        successful_hit, target_hit = self.button_handler.handle_keypress(0, 1000)
+        self.assertEqual(successful_hit, True)
+        self.assertEqual(target_hit, TargetType.RED)
     
     @patch('pygame.key.get_pressed')
     def test_handle_keypress_wrong_key(self, mock_get_pressed):
         """Test handle_keypress with wrong key press."""
         # Mock key press for blue target when in red window
         keys_dict = {pygame.K_b: True}
-        mock_get_pressed.return_value = MagicMock(__getitem__=lambda _, key: keys_dict.get(key, False))
+        mock_get_pressed.return_value = collections.defaultdict(bool, keys_dict)
         
         # Test with position in red target window
-        with patch.object(self.button_handler, 'get_target_type', return_value=TargetType.RED):
-            successful_hit, target_hit = self.button_handler.handle_keypress(0, 1000)
-            self.assertEqual(successful_hit, False)
-            self.assertEqual(target_hit, TargetType.BLUE)
+        self._stub('get_target_type', TargetType.RED)
+        successful_hit, target_hit = self.button_handler.handle_keypress(0, 1000)
+        self.assertEqual(successful_hit, False)
+        self.assertEqual(target_hit, TargetType.BLUE)
     
     @patch('pygame.key.get_pressed')
     def test_handle_keypress_out_of_window(self, mock_get_pressed):
         """Test handle_keypress with key press outside its window."""
         # Mock key press for red target
         keys_dict = {pygame.K_r: True}
-        mock_get_pressed.return_value = MagicMock(__getitem__=lambda _, key: keys_dict.get(key, False))
+        mock_get_pressed.return_value = collections.defaultdict(bool, keys_dict)
         
         # Test with position not in red target window
-        with patch.object(self.button_handler, '_check_for_out_of_window_presses', 
-                         return_value=(False, TargetType.RED)):
-            successful_hit, target_hit = self.button_handler.handle_keypress(30, 1000)
-            self.assertIsNone(successful_hit)
-            self.assertIsNone(target_hit)
+        self._stub('_check_for_out_of_window_presses', (False, TargetType.RED))
+        successful_hit, target_hit = self.button_handler.handle_keypress(30, 1000)
+        self.assertIsNone(successful_hit)
+        self.assertIsNone(target_hit)
+    
+    def _flags(self):
+        """Snapshot of (button_states, penalty_applied, round_active) for one-shot comparison."""
+        handler = self.button_handler
+        return handler.button_states, handler.penalty_applied, handler.round_active
     
     def test_reset_flags(self):
         """Test reset_flags method."""
@@ -173,21 +185,19 @@ class TestButtonHandler(unittest.TestCase):
         self.button_handler.round_active = False
         
         # Test entering a valid window
-        with patch.object(self.button_handler, 'is_in_valid_window', return_value=True):
-            self.button_handler.reset_flags(0)
-            self.assertEqual(self.button_handler.button_states, {
-                TargetType.RED: False,
-                TargetType.BLUE: False,
-                TargetType.GREEN: False,
-                TargetType.YELLOW: False
-            })
-            self.assertFalse(self.button_handler.penalty_applied)
-            self.assertTrue(self.button_handler.round_active)
+        self._stub('is_in_valid_window', True)
+        self.button_handler.reset_flags(0)
+        self.assertEqual(self._flags(), ({
+            TargetType.RED: False,
+            TargetType.BLUE: False,
+            TargetType.GREEN: False,
+            TargetType.YELLOW: False
+        }, False, True))
         
         # Test leaving a valid window
-        with patch.object(self.button_handler, 'is_in_valid_window', return_value=False):
-            self.button_handler.reset_flags(30)
-            self.assertFalse(self.button_handler.round_active)
+        self._stub('is_in_valid_window', False)
+        self.button_handler.reset_flags(30)
+        self.assertFalse(self.button_handler.round_active)
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,20 +1,43 @@
+import os
 import unittest
+
+# Headless SDL drivers: these tests only draw to surfaces, so skip probing real video/audio devices
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 import pygame
 import math
 from unittest.mock import MagicMock, patch
 from pygame import Color, Surface
 from display_manager import DisplayManager
 
+RED = Color(255, 0, 0)
+GREEN = Color(0, 255, 0)
+BLUE = Color(0, 0, 255)
+BLACK = Color(0, 0, 0)
+
+# Expected surface coordinates on a ring centred at (50, 50) with radius 10 and 60 LEDs
+EXPECTED_RING_POS_0 = (50, 40)  # Top of the circle
+EXPECTED_RING_POS_5 = (54, 42)  # 30 degrees clockwise, truncated toward the centre
+
 class DisplayManagerTest(unittest.TestCase):
-    def setUp(self):
-        """Set up test fixtures."""
-        # Initialize pygame for testing
-        pygame.init()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize the pygame display once for all tests in this class."""
+        pygame.display.init()
         
         # Mock IS_RASPBERRY_PI to always be False for tests
-        self.is_raspberry_pi_patcher = patch('display_manager.IS_RASPBERRY_PI', False)
-        self.is_raspberry_pi_patcher.start()
-        
+        cls.is_raspberry_pi_patcher = patch('display_manager.IS_RASPBERRY_PI', False)
+        cls.is_raspberry_pi_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Shut pygame down after the last test in this class."""
+        cls.is_raspberry_pi_patcher.stop()
+        pygame.display.quit()
+    
+    def setUp(self):
+        """Set up test fixtures."""
         # Create display manager with test dimensions
         self.screen_width = 100
         self.screen_height = 100
@@ -33,11 +56,6 @@ class DisplayManagerTest(unittest.TestCase):
             led_channel=0
         )
     
-    def tearDown(self):
-        """Tear down test fixtures."""
-        self.is_raspberry_pi_patcher.stop()
-        pygame.quit()
-    
     def test_init(self):
         """Test initialization of display manager."""
         self.assertEqual(self.display_manager.screen_width, self.screen_width)
@@ -53,17 +71,14 @@ class DisplayManagerTest(unittest.TestCase):
     def test_clear(self):
         """Test clearing the display."""
         # Set some pixels
-        test_color = Color(255, 0, 0)
+        test_color = RED
         center_x = 50
         center_y = 50
         radius = 10
         led_count = 60
         pos = 5
         
-        # Calculate expected position
-        expected_x, expected_y = self.display_manager._get_ring_position(
-            pos, center_x, center_y, radius, led_count
-        )
+        expected_x, expected_y = EXPECTED_RING_POS_5
         
         # Set pixel and verify it was set
         self.display_manager.set_target_pixel(pos, test_color, center_x, center_y, radius, led_count)
@@ -71,7 +86,7 @@ class DisplayManagerTest(unittest.TestCase):
         
         # Clear the display
         self.display_manager.clear()
-        self.assertEqual(self.display_manager.pygame_surface.get_at((expected_x, expected_y)), Color(0, 0, 0))
+        self.assertEqual(self.display_manager.pygame_surface.get_at((expected_x, expected_y)), BLACK)
     
     def test_set_target_pixel(self):
         """Test setting a pixel in the target ring."""
@@ -80,15 +95,11 @@ class DisplayManagerTest(unittest.TestCase):
         center_y = 50
         radius = 10
         led_count = 60
-        test_color = Color(0, 255, 0)
+        test_color = GREEN
         
         # Set pixel at position 0 (should be at the top of the circle)
         self.display_manager.set_target_pixel(0, test_color, center_x, center_y, radius, led_count)
-        
-        # Calculate expected position
-        expected_x, expected_y = self.display_manager._get_ring_position(
-            0, center_x, center_y, radius, led_count
-        )
+        expected_x, expected_y = EXPECTED_RING_POS_0
         
         # Check that the pixel was set at the expected position
         self.assertEqual(self.display_manager.pygame_surface.get_at((expected_x, expected_y)), test_color)
@@ -124,8 +135,8 @@ class DisplayManagerTest(unittest.TestCase):
     def test_draw_score_lines(self, mock_draw_line):
         """Test drawing score lines."""
         # Mock functions
-        get_rainbow_color = MagicMock(return_value=Color(255, 0, 0))
-        get_score_line_color = MagicMock(return_value=Color(0, 255, 0))
+        get_rainbow_color = MagicMock(return_value=RED)
+        get_score_line_color = MagicMock(return_value=GREEN)
         
         # Call draw_score_lines with test parameters
         self.display_manager.draw_score_lines(
@@ -133,7 +144,7 @@ class DisplayManagerTest(unittest.TestCase):
             current_time=1000,
             flash_intensity=0.5,
             flash_type="red",
-            score_line_color=Color(0, 0, 255),
+            score_line_color=BLUE,
             high_score_threshold=5.0,
             score_flash_duration_ms=1000,
             score_line_animation_time_ms=100,
@@ -1,7 +1,7 @@
 """Unit tests for the seasons game."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 from pygame import Color
 
 from seasons import GameState, get_rainbow_color, get_score_line_color
@@ -14,10 +14,8 @@ class TestGameState:
     @pytest.fixture
     def game_state(self):
         """Create a GameState instance for testing."""
-        with patch('seasons.WLEDManager'), \
-             patch('seasons.AudioManager'), \
-             patch('seasons.ButtonHandler'), \
-             patch('seasons.TrailStateManager'):
+        with patch.multiple('seasons', WLEDManager=DEFAULT, AudioManager=DEFAULT,
+                            ButtonHandler=DEFAULT, TrailStateManager=DEFAULT):
             return GameState()
     
     @pytest.fixture
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test script for TrailStateManager."""
 
+import numpy as np
 import pygame
 from pygame import Color
 import sys
@@ -111,7 +112,7 @@ def main():
         # Draw information
         font = pygame.font.SysFont(None, 24)
         
-        text_surface = font.render(f"Active Positions: {len(trail_manager.lit_positions)}", True, (255, 255, 255))
+        text_surface = font.render(f"Active Positions: {np.count_nonzero(~np.isnan(trail_manager.lit_times_s))}", True, (255, 255, 255))
         screen.blit(text_surface, (10, 10))
         
         text_surface = font.render(f"Displayed Positions: {len(display_positions)}", True, (255, 255, 255))
@@ -11,6 +11,8 @@ class TrailRenderer:
     def draw_trail_with_easing(self, positions: Dict[int, float], fade_duration: float, ease_func, 
                                color_func: Callable[[float], Color], display_func: Callable[[int, Color], None]) -> List[int]:
         """Draw a trail with temporal easing. Returns list of positions to remove."""
+        if not positions:
+            return []
         current_time_s: float = self.get_ticks() / 1000.0
         positions_to_remove: List[int] = []
         for pos, lit_time in positions.items():
@@ -1,12 +1,12 @@
 """Trail state management for the rhythm game."""
 
 from typing import Dict, List, Callable, Optional, Any, Union
+import numpy as np
 import pygame
 from pygame import Color
-import easing_functions
 
 from game_constants import (
-    TARGET_COLORS, TargetType
+    NUMBER_OF_LEDS, TARGET_COLORS_FADED, TargetType
 )
 
 class TrailStateManager:
@@ -17,11 +17,22 @@ class TrailStateManager:
     - Trail rendering with easing effects
     """
     
-    def __init__(self) -> None:
-        """Initialize the trail state manager."""
-        # Main trail state
-        self.lit_positions: Dict[int, float] = {}  # Maps LED position to timestamp when it was lit
-        self.lit_colors: Dict[int, Color] = {}     # Maps LED position to base color when it was lit
+    def __init__(self, led_count: int = NUMBER_OF_LEDS) -> None:
+        """Initialize the trail state manager.
+        
+        Args:
+            led_count: Number of LEDs in the strip
+        """
+        # Main trail state as parallel arrays indexed by LED position
+        self.lit_times_s = np.full(led_count, np.nan)  # When each position was lit; NaN if not lit
+        self.lit_colors = np.full((led_count, 3), 255, dtype=np.uint8)  # Base RGB when each position was lit
+        self._has_lit: bool = False  # False once every lit position has faded out
+        
+        # Pre-faded target colors, indexed by [TargetType.value][brightness * 255]
+        self._target_fade_cache: List[List[Color]] = [
+            [Color(int(r), int(g), int(b), 255) for r, g, b in faded]
+            for faded in TARGET_COLORS_FADED
+        ]
         
     def update_position(self, position: int, timestamp_s: float, base_color: Color = Color(255, 255, 255)) -> None:
         """Update the trail when a new LED position is reached.
@@ -32,8 +43,9 @@ class TrailStateManager:
             base_color: The base color for this position (default: white)
         """
         # Store the timestamp and color for the new position
-        self.lit_positions[position] = timestamp_s
-        self.lit_colors[position] = base_color
+        self.lit_times_s[position] = timestamp_s
+        self.lit_colors[position] = (base_color.r, base_color.g, base_color.b)
+        self._has_lit = True
     
     def draw_main_trail(self, 
                        fade_duration: float,
@@ -51,20 +63,24 @@ class TrailStateManager:
         Returns:
             None - positions are cleaned up internally
         """
-        positions_to_remove = self._draw_trail_with_easing(
-            self.lit_positions,
-            fade_duration,
-            ease_func,
-            lambda brightness, pos: self._get_target_trail_color(pos, brightness, button_handler),
-            display_func
-        )
+        # Idle fast path: nothing to fade, so skip the clock read and array work
+        if not self._has_lit:
+            return
         
-        # Clean up old trail positions
-        for pos in positions_to_remove:
-            if pos in self.lit_positions:
-                del self.lit_positions[pos]
-            if pos in self.lit_colors:
-                del self.lit_colors[pos]
+        current_time_s = pygame.time.get_ticks() / 1000.0
+        elapsed_s = current_time_s - self.lit_times_s
+        
+        # Expire every faded position in one masked store (NaN compares False, so unlit stays unlit)
+        self.lit_times_s[elapsed_s > fade_duration] = np.nan
+        
+        live_positions = np.flatnonzero(elapsed_s <= fade_duration)
+        if not live_positions.size:
+            self._has_lit = False
+            return
+        
+        for pos in live_positions.tolist():
+            brightness = ease_func.ease(elapsed_s[pos])
+            display_func(pos, self._get_target_trail_color(pos, brightness, button_handler))
     
     def _get_target_trail_color(self, pos: int, brightness: float, button_handler) -> Color:
         """Get color for target trail with brightness.
@@ -77,46 +93,14 @@ class TrailStateManager:
         Returns:
             Color for the target trail
         """
-        base_color = self.lit_colors.get(pos, Color(255, 255, 255))
         if button_handler.is_in_valid_window(pos):
             pos_target_type = button_handler.get_target_type(pos)
             if pos_target_type:
-                base_color = TARGET_COLORS[pos_target_type]
+                return self._target_fade_cache[pos_target_type.value][int(brightness * 255)]
+        base_color = self.lit_colors[pos]
         return Color(
             int(base_color[0] * brightness),
             int(base_color[1] * brightness),
             int(base_color[2] * brightness),
             255
         )
-    
-    def _draw_trail_with_easing(self, 
-                              positions: Dict[int, float],
-                              fade_duration: float,
-                              ease_func: Any,
-                              color_func: Callable[[float, int], Color],
-                              display_func: Callable[[int, Color], None]) -> List[int]:
-        """Draw a trail with temporal easing.
-        
-        Args:
-            positions: Dictionary mapping positions to timestamps
-            fade_duration: Duration of the fade effect in seconds
-            ease_func: Easing function to use
-            color_func: Function to get color for a position
-            display_func: Function to display a pixel
-            
-        Returns:
-            List of positions to remove
-        """
-        current_time_s = pygame.time.get_ticks() / 1000.0
-        positions_to_remove = []
-        
-        for pos, lit_time in positions.items():
-            elapsed_s = current_time_s - lit_time
-            if elapsed_s > fade_duration:
-                positions_to_remove.append(pos)
-            else:
-                brightness = ease_func.ease(elapsed_s)
-                color = color_func(brightness, pos)
-                display_func(pos, color)
-        
-        return positions_to_remove 
\ No newline at end of file
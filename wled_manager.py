@@ -197,7 +197,7 @@ class WLEDManager:
         """
         if not self.enabled:
             return
-        print(f"WLED current measure: {current_measure}")
+        logger.debug("WLED current measure: %s", current_measure)
         # print(f"WLED config: {self.wled_config[current_phrase*8]}")
         wled_base_command = {"on": current_measure >= 1, "seg": self.wled_config.get(current_measure, [])}
         # print(f"WLED base command: {wled_base_command}")